@@ -51,6 +51,22 @@ class TestLaplaceSolver2D(unittest.TestCase):
         # Verificar que la solución no es trivial (no todos los puntos son cero)
         self.assertGreater(np.max(solver.V), 5.0)
     
+    def test_float32(self):
+        """
+        Precisión simple: con dtype=np.float32 la solución debe coincidir
+        con la de float64 dentro de unas pocas veces la tolerancia.
+        """
+        solver_32 = LaplaceSolver2D(N=30, dtype=np.float32)
+        solver_32.set_boundary_conditions(left=0.0, right=10.0, top=0.0, bottom=0.0)
+        solver_32.resolver(tolerance=1e-5, max_iter=10000, method="sor")
+
+        solver_64 = LaplaceSolver2D(N=30)
+        solver_64.set_boundary_conditions(left=0.0, right=10.0, top=0.0, bottom=0.0)
+        solver_64.resolver(tolerance=1e-5, max_iter=10000, method="sor")
+
+        self.assertEqual(solver_32.V.dtype, np.float32)
+        np.testing.assert_allclose(solver_32.V, solver_64.V, atol=5e-4)
+
     def test_calculo_campo_electrico(self):
         """
         Cálculo del Campo: Verificar que el cálculo del campo eléctrico es correcto 
@@ -71,5 +87,103 @@ class TestLaplaceSolver2D(unittest.TestCase):
         np.testing.assert_array_almost_equal(Ex[1:-1, 1:-1], -2.0, decimal=2)
         np.testing.assert_array_almost_equal(Ey[1:-1, 1:-1], -3.0, decimal=2)
 
+    def test_sor_acelera_convergencia(self):
+        """
+        SOR: con el omega óptimo el método debe converger a la misma solución
+        que Gauss-Seidel puro (omega=1.0) pero en menos iteraciones.
+        """
+        solver_gs = LaplaceSolver2D(N=30)
+        solver_gs.set_boundary_conditions(left=0.0, right=10.0, top=0.0, bottom=0.0)
+        iter_gs = solver_gs.resolver(tolerance=1e-6, max_iter=10000,
+                                     method="gauss-seidel")
+
+        solver_sor = LaplaceSolver2D(N=30)
+        solver_sor.set_boundary_conditions(left=0.0, right=10.0, top=0.0, bottom=0.0)
+        iter_sor = solver_sor.resolver(tolerance=1e-6, max_iter=10000, method="sor")
+
+        # Misma solución dentro de la tolerancia
+        np.testing.assert_allclose(solver_sor.V, solver_gs.V, atol=1e-3)
+
+        # La sobre-relajación reduce el número de iteraciones
+        self.assertLess(iter_sor, iter_gs)
+
+    def test_solver_directo(self):
+        """
+        Solver directo: la solución de la factorización dispersa debe
+        coincidir con la del método iterativo dentro de la tolerancia.
+        """
+        solver_it = LaplaceSolver2D(N=25)
+        solver_it.set_boundary_conditions(left=5.0, right=10.0, top=0.0, bottom=-5.0)
+        solver_it.resolver(tolerance=1e-8, max_iter=20000, method="sor")
+
+        solver_dir = LaplaceSolver2D(N=25)
+        solver_dir.set_boundary_conditions(left=5.0, right=10.0, top=0.0, bottom=-5.0)
+        iterations = solver_dir.resolver(method="directo")
+
+        self.assertEqual(iterations, 1)
+        np.testing.assert_allclose(solver_dir.V, solver_it.V, atol=1e-5)
+
+    def test_jacobi(self):
+        """
+        Jacobi: el método con doble buffer debe converger a la misma
+        solución que el solver directo.
+        """
+        solver_jac = LaplaceSolver2D(N=20)
+        solver_jac.set_boundary_conditions(left=0.0, right=10.0, top=0.0, bottom=0.0)
+        iterations = solver_jac.resolver(tolerance=1e-7, max_iter=20000,
+                                         method="jacobi")
+
+        solver_dir = LaplaceSolver2D(N=20)
+        solver_dir.set_boundary_conditions(left=0.0, right=10.0, top=0.0, bottom=0.0)
+        solver_dir.resolver(method="directo")
+
+        self.assertLess(iterations, 20000)
+        np.testing.assert_allclose(solver_jac.V, solver_dir.V, atol=1e-4)
+
+    def test_constructor_con_condiciones(self):
+        """
+        Constructor alternativo: el diccionario de condiciones de contorno
+        debe equivaler a llamar a set_boundary_conditions.
+        """
+        solver = LaplaceSolver2D.from_boundary_conditions(
+            N=15, boundary_conditions={"left": 1.0, "top": 4.0})
+
+        solver_ref = LaplaceSolver2D(N=15)
+        solver_ref.set_boundary_conditions(left=1.0, top=4.0)
+
+        np.testing.assert_array_equal(solver.V, solver_ref.V)
+
+    def test_multigrid(self):
+        """
+        Multimalla: los ciclos V deben alcanzar la solución del solver
+        directo en pocos ciclos para una malla jerárquica (N = 2^k + 1).
+        """
+        solver_mg = LaplaceSolver2D(N=33)
+        solver_mg.set_boundary_conditions(left=0.0, right=10.0, top=5.0, bottom=0.0)
+        ciclos = solver_mg.resolver(tolerance=1e-8, method="multigrid")
+
+        solver_dir = LaplaceSolver2D(N=33)
+        solver_dir.set_boundary_conditions(left=0.0, right=10.0, top=5.0, bottom=0.0)
+        solver_dir.resolver(method="directo")
+
+        self.assertLess(ciclos, 20)
+        np.testing.assert_allclose(solver_mg.V, solver_dir.V, atol=1e-6)
+
+    def test_solver_fft(self):
+        """
+        Solver espectral: la solución por DST debe coincidir con la del
+        solver directo disperso hasta precisión de máquina.
+        """
+        solver_dir = LaplaceSolver2D(N=30)
+        solver_dir.set_boundary_conditions(left=5.0, right=10.0, top=0.0, bottom=-5.0)
+        solver_dir.resolver(method="directo")
+
+        solver_fft = LaplaceSolver2D(N=30)
+        solver_fft.set_boundary_conditions(left=5.0, right=10.0, top=0.0, bottom=-5.0)
+        iterations = solver_fft.resolver(method="fft")
+
+        self.assertEqual(iterations, 1)
+        np.testing.assert_allclose(solver_fft.V, solver_dir.V, atol=1e-10)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -1,10 +1,48 @@
 # setup.py
 from pathlib import Path
-from setuptools import setup, find_packages
+from setuptools import Extension, setup, find_packages
+from setuptools.command.build_ext import build_ext as _build_ext
 
 HERE = Path(__file__).parent
 README = (HERE / "README.md").read_text(encoding="utf-8") if (HERE / "README.md").exists() else ""
 
+# Extensión opcional: núcleo del barrido compilado con OpenMP para entornos
+# sin Numba. Si Cython no está disponible al construir, el paquete se
+# instala igualmente y el solver usa sus rutas NumPy/Numba.
+try:
+    from Cython.Build import cythonize
+
+    ext_modules = cythonize(
+        [
+            Extension(
+                "campo_estatico_mdf._sweep",
+                ["campo_estatico_mdf/_sweep.pyx"],
+                extra_compile_args=["-O3", "-fopenmp"],
+                extra_link_args=["-fopenmp"],
+            )
+        ]
+    )
+except ImportError:
+    ext_modules = []
+
+
+class build_ext(_build_ext):
+    """build_ext que además precompila el barrido AOT de Numba.
+
+    Elimina la latencia de compilación JIT en el primer solve de los
+    usuarios. Cualquier fallo (sin Numba, sin compilador C) se ignora:
+    el solver cae a sus rutas JIT/Cython/NumPy.
+    """
+
+    def run(self):
+        try:
+            from campo_estatico_mdf._aot_build import cc
+
+            cc.compile()
+        except Exception:
+            pass
+        super().run()
+
 setup(
     name="campo_estatico_mdf",
     use_scm_version=True,  # usa setuptools_scm (coincide con pyproject.toml)
@@ -16,6 +54,8 @@ setup(
     author_email="jppatinob@udistrital.edu.co, alpinedam@udistrital.edu.co",
     url="https://github.com/angielorenapm/Laplace2D",
     packages=find_packages(where="."),
+    ext_modules=ext_modules,
+    cmdclass={"build_ext": build_ext},
     include_package_data=True,
     package_data={"campo_estatico_mdf": ["py.typed"]},
     install_requires=[